@@ -0,0 +1,37 @@
+import pygame
+
+LABEL_COLOR = (0, 255, 128)
+CURED_LABEL_COLOR = (0, 255, 0)
+
+
+class Assets:
+    """Fonts and pre-rendered text used by the board.
+
+    Loading fonts is the slowest part of startup (SysFont scans the system
+    fonts), so main.py builds this on a background thread. Only plain
+    surfaces are created, which is safe off the main thread.
+    """
+
+    def __init__(self, cities=()):
+        self.font = pygame.font.SysFont('Arial', 14)
+        self.small_font = pygame.font.SysFont('Arial', 10)
+        self.label_font = pygame.font.SysFont('Press Start 2P,Consolas,Courier New,Arial', 17, bold=True)
+        self.initial_font = pygame.font.SysFont('Arial', 14, bold=True)
+        self._labels = {}
+        self._initials = {}
+        for city in cities:
+            self.city_label(city.name, LABEL_COLOR)
+
+    def city_label(self, name: str, color):
+        """Return the (text, outline) surfaces for a city name, rendering them once."""
+        key = (name, color)
+        if key not in self._labels:
+            self._labels[key] = (self.label_font.render(name, True, color),
+                                 self.label_font.render(name, True, (0, 0, 0)))
+        return self._labels[key]
+
+    def initials(self, text: str):
+        """Return the surface for a player token's initials, rendering it once."""
+        if text not in self._initials:
+            self._initials[text] = self.initial_font.render(text, True, (0, 0, 0))
+        return self._initials[text]
@@ -0,0 +1,51 @@
+"""Measure the cost of the game's event bus on the headless engine.
+
+Runs the same stream of actions with no subscribers, with an immediate
+subscriber and with a per-frame batched subscriber, and prints the time per
+action for each.
+
+    python bench_events.py [actions]
+"""
+import sys
+import time
+
+from game import Game
+
+
+def run(actions: int, setup=None) -> float:
+    """Return the average seconds per perform_action call."""
+    game = Game(seed=0)
+    game.set_game_initial_state()
+    game.start_game()
+    if setup:
+        setup(game.events)
+    cycle = ['move', 'treat_disease', 'build_center', 'find_cure']
+    start = time.perf_counter()
+    for i in range(actions):
+        action = cycle[i % len(cycle)]
+        if action == 'move':
+            game.perform_action(action, game.get_current_player().city.neighbors[0])
+        else:
+            game.perform_action(action)
+        if i % 100 == 0:
+            game.events.flush('frame')
+    return (time.perf_counter() - start) / actions
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    actions = int(argv[0]) if argv else 200000
+    scenarios = [
+        ('no subscribers', None),
+        ('immediate subscriber', lambda bus: bus.subscribe(lambda event: None)),
+        ('frame batched subscriber', lambda bus: bus.subscribe(lambda events: None, batch='frame')),
+    ]
+    baseline = None
+    for name, setup in scenarios:
+        per_action = run(actions, setup)
+        baseline = baseline or per_action
+        print(f"{name:<26} {per_action * 1e6:8.2f} us/action  ({per_action / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
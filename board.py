@@ -1,28 +1,18 @@
 import pygame
 
 import math
+import random
 from typing import List, Tuple
 from city import City
 from game import Game
+from camera import Camera, SpatialGrid
+from quality import QualityController
+from events import PlayerMoved
+from assets import Assets, LABEL_COLOR, CURED_LABEL_COLOR
 import platform
+import time
 import ctypes
 
-# Initialize Pygame
-pygame.init()
-
-# Screen dimensions
-if platform.system() == "Windows":
-    user32 = ctypes.windll.user32
-    WIDTH = user32.GetSystemMetrics(0)
-    HEIGHT = user32.GetSystemMetrics(1)
-else:
-    display_info = pygame.display.Info()
-    WIDTH = display_info.current_w
-    HEIGHT = display_info.current_h
-
-screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
-pygame.display.set_caption("Pandemic Board Game")
-
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -31,12 +21,52 @@ YELLOW = (255, 255, 0)
 RED = (255, 0, 0)
 GRAY = (200, 200, 200)
 
+# Level-of-detail thresholds, in screen pixels between neighbouring cities on
+# average, so they scale with the map's density rather than its coordinates
+LABEL_MIN_SPACING = 40   # City names (and player initials when zoomed out past the fit view)
+SHADOW_MIN_SPACING = 30  # City and edge drop shadows
+PULSE_MIN_SPACING = 20   # Animated edge/city pulses
+
+PLAYER_COLORS = [(0,255,255), (255,128,0), (0,255,128), (255,0,128), (255,255,0), (128,0,255), (255,0,0), (0,128,255)]
+
+def desktop_size():
+    """Screen dimensions, used as the initial window size. Needs pygame.init()"""
+    if platform.system() == "Windows":
+        user32 = ctypes.windll.user32
+        return user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
+    display_info = pygame.display.Info()
+    return display_info.current_w, display_info.current_h
+
+def draw_loading_screen(surface, t):
+    """Draw the frame shown while the map and fonts load. Uses no fonts, so it
+    can be drawn while the assets are still loading on another thread."""
+    surface.fill((0, 0, 0))
+    width, height = surface.get_size()
+    bar = pygame.Rect(0, 0, min(400, width - 40), 12)
+    bar.center = (width // 2, height // 2)
+    pygame.draw.rect(surface, (80,200,255), bar, 2, border_radius=6)
+    # Neon pulse sweeping along the bar
+    pulse_w = bar.width // 4
+    pulse_x = bar.x + int((bar.width - pulse_w) * (0.5 + 0.5 * math.sin(t * 3)))
+    pygame.draw.rect(surface, (255,80,180), (pulse_x, bar.y + 3, pulse_w, bar.height - 6), border_radius=3)
+
 class Board:
-    def __init__(self, game: Game):
+    def __init__(self, game: Game, render_size: Tuple[int, int] = None, quality: QualityController = None,
+                 surface: pygame.Surface = None, assets: Assets = None):
         self.game = game
+        # Fonts and pre-rendered labels; main.py loads them in the background
+        self.assets = assets or Assets(game.cities)
+        # Draw on this surface instead of the display (offscreen export)
+        self.surface = surface
+        # When set, the board is drawn on an offscreen surface of this size and
+        # scaled up to the window, instead of rendering at native resolution
+        self.render_size = render_size
+        self.quality = quality or QualityController()
+        self._render_surface = None
+        self._layers_key = None  # Screen size the cached background layers were built for
 
-        self.font = pygame.font.SysFont('Arial', 14)
-        self.small_font = pygame.font.SysFont('Arial', 10)
+        self.font = self.assets.font
+        self.small_font = self.assets.small_font
         self.selected_city = None
         self.action_buttons = []
         self.action_names = [
@@ -47,6 +77,19 @@ class Board:
         ]
         self.move_mode = False  # True when waiting for player to pick a neighbor city to move
         self.highlighted_cities = []  # Cities currently highlighted for movement
+        self.camera = Camera()
+        self._map_key = None  # Identity of the city list the spatial indexes were built for
+        self._edge_key = None  # Screen width and fit zoom the edge index was built for
+        self._bounds = (0, 0, 0, 0)
+        self._city_spacing = 1.0
+        self._city_grid = None
+        self._edge_grid = None
+        self._city_index = {}
+        # Players standing in each city, kept up to date from PlayerMoved events
+        self._players_by_city = {}
+        for player in game.players:
+            self._players_by_city.setdefault(player.city, []).append(player)
+        game.events.subscribe(self._on_players_moved, [PlayerMoved], batch='frame')
 
 
 
@@ -62,15 +105,148 @@ class Board:
             return (0, 0, 0)
         return GRAY
 
+    def _get_neon_color(self, city):
+        """Get the neon color used for a city and its connections"""
+        # Use green if disease is cured, otherwise use disease color
+        if city.disease.has_cure:
+            return (0, 255, 0)
+        color = city.disease.color
+        return (80,200,255) if color=="Blue" else (255,220,90) if color=="Yellow" else (255,80,180) if color=="Red" else (170,80,255)
+
+    def _on_players_moved(self, events):
+        """Refresh the token lists of the cities players left or entered"""
+        for city in {c for event in events for c in (event.from_city, event.to_city)}:
+            players_here = [p for p in self.game.players if p.city == city]
+            if players_here:
+                self._players_by_city[city] = players_here
+            else:
+                self._players_by_city.pop(city, None)
+
+    def _map_bounds(self):
+        """World-space bounding box (min_x, min_y, max_x, max_y) of all cities"""
+        xs = [c.coordinates[0] for c in self.game.cities]
+        ys = [c.coordinates[1] for c in self.game.cities]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def _update_camera(self, width, height):
+        """Refresh the camera and rebuild the spatial indexes when the map or screen changes"""
+        map_key = (id(self.game.cities), len(self.game.cities))
+        if map_key != self._map_key:
+            self._map_key = map_key
+            self._bounds = self._map_bounds()
+            # Average map distance between cities, as if they were spread evenly.
+            # Cities all on one line are spread along it instead.
+            min_x, min_y, max_x, max_y = self._bounds
+            count = len(self.game.cities)
+            area = (max_x - min_x) * (max_y - min_y) or max(max_x - min_x, max_y - min_y) ** 2 / count
+            self._city_spacing = math.sqrt(area / count) if area else 1.0
+            self._city_index = {city: i for i, city in enumerate(self.game.cities)}
+            # Cells a few cities wide, whatever the map's coordinate scale
+            self._city_grid = SpatialGrid(cell_size=2 * self._city_spacing)
+            for city in self.game.cities:
+                x, y = city.coordinates
+                self._city_grid.insert(city, (x, y, x, y))
+            self._edge_key = None
+        self.camera.update(self._bounds, width, height)
+        edge_key = (width, self.camera.fit_zoom)
+        if edge_key == self._edge_key:
+            return
+        self._edge_key = edge_key
+        # Connections longer than half the screen wrap around the map edge, as on the real board
+        wrap = width / self.camera.fit_zoom
+        self._edge_grid = SpatialGrid(cell_size=2 * self._city_spacing)
+        for city in self.game.cities:
+            x, y = city.coordinates
+            for neighbor in city.neighbors:
+                if neighbor not in self._city_index:  # Ensure neighbor is in our cities list
+                    continue
+                nx, ny = neighbor.coordinates
+                if abs(x - nx) > wrap / 2:
+                    nx = nx + wrap if x > nx else nx - wrap
+                self._edge_grid.insert_segment((city, (x, y), (nx, ny)), (x, y), (nx, ny))
+
+    def _begin_frame(self):
+        """Return the surface this frame is drawn on"""
+        if self.surface is not None:
+            return self.surface
+        display = pygame.display.get_surface()
+        if self.render_size is None:
+            return display
+        if self._render_surface is None or self._render_surface.get_size() != tuple(self.render_size):
+            self._render_surface = pygame.Surface(self.render_size, 0, display)
+        return self._render_surface
+
+    def _present(self, surface):
+        """Scale the offscreen render surface up to the window"""
+        display = pygame.display.get_surface()
+        if surface is display or surface is self.surface:
+            return
+        if self.quality.settings['smooth_scale']:
+            pygame.transform.smoothscale(surface, display.get_size(), display)
+        else:
+            pygame.transform.scale(surface, display.get_size(), display)
+
+    def _to_render_pos(self, pos):
+        """Map a window position to render surface coordinates"""
+        if self.render_size is None:
+            return pos
+        display_w, display_h = pygame.display.get_surface().get_size()
+        render_w, render_h = self.render_size
+        return int(pos[0] * render_w / display_w), int(pos[1] * render_h / display_h)
+
+    def _build_background_layers(self, width, height):
+        """Pre-render the static neon glows and vignette for the given screen size"""
+        self._layers_key = (width, height)
+        # Fixed seeds on private generators: the layout never changes and the
+        # game's random state is left alone
+        # --- Static Neon Mini-Glows ---
+        rng = random.Random(99)
+        inset_x, inset_y = min(30, width // 2), min(30, height // 2)  # Keep tiny surfaces valid
+        neon_dots = [
+            (rng.randint(inset_x, width-inset_x), rng.randint(inset_y, height-inset_y), rng.choice([(80,200,255), (255,80,180), (255,220,90), (170,80,255)]), rng.randint(4,8), rng.randint(8,22))
+            for _ in range(10)
+        ]
+        self._glow_layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        for x, y, col, r, alpha in neon_dots:
+            if r <= 4:
+                pygame.draw.circle(self._glow_layer, col+(alpha,), (x, y), r)
+            # else: skip medium/large dots entirely
+        # --- Twinkling Neon Starfield ---
+        rng = random.Random(42)
+        self._starfield = [(rng.randint(0, max(0, width-1)), rng.randint(0, max(0, height-1)), rng.choice([(80,200,255), (255,80,180), (255,220,90), (170,80,255)]), rng.uniform(0, 2*math.pi)) for _ in range(80)]
+        # --- Neon Vignette ---
+        self._vignette_layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        for r in range(int(width*0.48), int(width*0.5)+1, 2):
+            pygame.draw.ellipse(self._vignette_layer, (80,200,255,8), self._vignette_layer.get_rect().inflate(-2*r, -2*r), 2)
+        for r in range(int(width*0.43), int(width*0.48), 3):
+            pygame.draw.ellipse(self._vignette_layer, (255,80,180,5), self._vignette_layer.get_rect().inflate(-2*r, -2*r), 2)
+
+    def _city_at(self, pos, radius):
+        """Return the city whose marker is within `radius` screen pixels of pos, if any"""
+        wx, wy = self.camera.screen_to_world(*pos)
+        r = radius / self.camera.zoom
+        for city in self._city_grid.query((wx - r, wy - r, wx + r, wy + r)):
+            city_x, city_y = self.camera.world_to_screen(*city.coordinates)
+            if math.hypot(pos[0] - city_x, pos[1] - city_y) < radius:
+                return city
+        return None
+
 
-    def draw(self):
-        """Draw the game board"""
+    def draw(self, t: float = None):
+        """Draw the game board. `t` is the animation time in seconds, defaulting
+        to the wall clock; pass it explicitly for reproducible frames."""
         # Clear the screen
         # Retro 80s arcade style background with nebula, vignette, and starfield
-        import time, math, random
-        t = time.time()
+        frame_start = time.perf_counter()
+        if t is None:
+            t = time.time()
+        settings = self.quality.settings
+        self.game.events.flush('frame')
+        screen = self._begin_frame()
         screen.fill((0, 0, 0))
         WIDTH, HEIGHT = screen.get_width(), screen.get_height()
+        self._update_camera(WIDTH, HEIGHT)
+        camera = self.camera
 
         # --- Action Menu ---
         menu_height = 70
@@ -96,210 +272,132 @@ class Board:
             # Get current city and its disease info
             current_city = player.city
             disease_info = f"{current_city.disease_quantity}"
-            
+
             # Create text with player info and disease info
             # Display player name
             player_name_text = self.font.render(f"Current Player: {player.name}", True, (255,255,255))
             screen.blit(player_name_text, (20, y-32))
-            
+
             # Display disease info and cure status
             disease_text = self.font.render(f"{current_city.disease.color} disease quantity: {disease_info}", True, (255,255,255))
             screen.blit(disease_text, (20, y-12))
-            
+
             # Display cure status if disease is cured
             if hasattr(current_city, 'disease') and hasattr(current_city.disease, 'has_cure') and current_city.disease.has_cure:
                 cure_text = self.font.render("CURED!", True, (0, 255, 0))
                 screen.blit(cure_text, (100, y-12))
-        # --- Neon/board drawing code continues as before ---
-
-        # ... (rest of your draw code) ...
-
-        # Compute zoom to fit all cities on screen with a margin
-        min_x = min(c.coordinates[0] for c in self.game.cities)
-        max_x = max(c.coordinates[0] for c in self.game.cities)
-        min_y = min(c.coordinates[1] for c in self.game.cities)
-        max_y = max(c.coordinates[1] for c in self.game.cities)
-        spread_x = max_x - min_x
-        spread_y = max_y - min_y
-        margin = 60
-        zoom_x = (WIDTH - 2 * margin) / spread_x if spread_x > 0 else 1.0
-        zoom_y = (HEIGHT - 2 * margin) / spread_y if spread_y > 0 else 1.0
-        zoom = min(zoom_x, zoom_y) * 0.9  
-        offset_x = (WIDTH - (spread_x * zoom)) // 2 - int(min_x * zoom)
-        offset_y = (HEIGHT - (spread_y * zoom)) // 2 - int(min_y * zoom)
-
-        # Draw cities, highlighting neighbors if in move mode
-        for city in self.game.cities:
-            city_x, city_y = city.coordinates
-            city_x = int(city_x * zoom + offset_x)
-            city_y = int(city_y * zoom + offset_y)
-            # If move mode and this city is a neighbor, highlight it
-            if self.move_mode and city in self.highlighted_cities:
-                pygame.draw.circle(screen, (0,255,0), (city_x, city_y), 20, 4)  # Green highlight
-            # ... (rest of city drawing as before) ...
 
-                pygame.draw.rect(screen, (255, 255, 255), rect, 4, border_radius=12)
-            text = self.font.render(label, True, (0,0,0))
-            screen.blit(text, (rect.x + (rect.width-text.get_width())//2, rect.y + (rect.height-text.get_height())//2))
-        # Show current player and actions left
-        player = self.game.get_current_player() if self.game.players else None
-        if player:
-            player_text = self.font.render(f"Current Player: {player.name}", True, (255,255,255))
-            screen.blit(player_text, (20, y-32))
-        # --- Static Neon Mini-Glows ---
-        if not hasattr(self, '_neon_dots') or len(self._neon_dots) != 10:
-            random.seed(99)
-            self._neon_dots = [
-                (random.randint(30, WIDTH-30), random.randint(30, HEIGHT-30), random.choice([(80,200,255), (255,80,180), (255,220,90), (170,80,255)]), random.randint(4,8), random.randint(8,22))
-                for _ in range(10)
-            ]
-        neon_dots = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        for x, y, col, r, alpha in self._neon_dots:
-            if r <= 4:
-                pygame.draw.circle(neon_dots, col+(alpha,), (x, y), r)
-            # else: skip medium/large dots entirely
-        screen.blit(neon_dots, (0,0), special_flags=pygame.BLEND_RGBA_ADD)
-        # --- Twinkling Neon Starfield ---
-        if not hasattr(self, '_starfield'):
-            random.seed(42)
-            self._starfield = [(random.randint(0, WIDTH-1), random.randint(0, HEIGHT-1), random.choice([(80,200,255), (255,80,180), (255,220,90), (170,80,255)]), random.uniform(0, 2*math.pi)) for _ in range(80)]
-        for sx, sy, scol, phase in self._starfield:
+        # Only cities and connections inside the viewport are drawn. Cities get a
+        # padding wide enough for their label and player tokens to stay visible.
+        visible_cities = self._city_grid.query(camera.viewport(padding=220))
+        visible_edges = self._edge_grid.query(camera.viewport())
+
+        # Highlight neighbors if in move mode
+        if self.move_mode:
+            for city in visible_cities:
+                if city in self.highlighted_cities:
+                    pygame.draw.circle(screen, (0,255,0), camera.world_to_screen(*city.coordinates), 20, 4)  # Green highlight
+
+        if self._layers_key != (WIDTH, HEIGHT):
+            self._build_background_layers(WIDTH, HEIGHT)
+        if settings['glow']:
+            screen.blit(self._glow_layer, (0,0), special_flags=pygame.BLEND_RGBA_ADD)
+        for sx, sy, scol, phase in self._starfield[:settings['starfield']]:
             tw = 120 + 80 * math.sin(t*2 + phase)
             pygame.draw.circle(screen, scol+(int(tw),), (sx, sy), 1)
-        # --- Neon Vignette ---
-        vignette = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        for r in range(int(WIDTH*0.48), int(WIDTH*0.5)+1, 2):
-            pygame.draw.ellipse(vignette, (80,200,255,8), vignette.get_rect().inflate(-2*r, -2*r), 2)
-        for r in range(int(WIDTH*0.43), int(WIDTH*0.48), 3):
-            pygame.draw.ellipse(vignette, (255,80,180,5), vignette.get_rect().inflate(-2*r, -2*r), 2)
-        screen.blit(vignette, (0,0), special_flags=pygame.BLEND_RGBA_ADD)
-
-
-        
-        # Compute zoom to fit all cities on screen with a margin
-        min_x = min(c.coordinates[0] for c in self.game.cities)
-        max_x = max(c.coordinates[0] for c in self.game.cities)
-        min_y = min(c.coordinates[1] for c in self.game.cities)
-        max_y = max(c.coordinates[1] for c in self.game.cities)
-        spread_x = max_x - min_x
-        spread_y = max_y - min_y
-        margin = 60
-        zoom_x = (WIDTH - 2 * margin) / spread_x if spread_x > 0 else 1.0
-        zoom_y = (HEIGHT - 2 * margin) / spread_y if spread_y > 0 else 1.0
-        zoom = min(zoom_x, zoom_y) * 0.9  
-        offset_x = (WIDTH - (spread_x * zoom)) // 2 - int(min_x * zoom)
-        offset_y = (HEIGHT - (spread_y * zoom)) // 2 - int(min_y * zoom)
+        if settings['vignette']:
+            screen.blit(self._vignette_layer, (0,0), special_flags=pygame.BLEND_RGBA_ADD)
+
+        # Level of detail for the current on-screen city spacing
+        spacing = self._city_spacing * camera.zoom
+        show_labels = spacing >= LABEL_MIN_SPACING
+        show_shadows = spacing >= SHADOW_MIN_SPACING
+        show_pulses = settings['pulses'] and spacing >= PULSE_MIN_SPACING
+        # Initials are the only way to tell tokens apart, so keep them at the fit view
+        show_initials = show_labels or camera.level >= 1.0
 
         # Draw subtle rounded border
         border_rect = pygame.Rect(10, 10, WIDTH-20, HEIGHT-20)
         pygame.draw.rect(screen, (180, 180, 220), border_rect, 3, border_radius=24)
 
         # Draw connections between cities
-        for city in self.game.cities:
-            city_x, city_y = city.coordinates
-            city_x = int(city_x * zoom + offset_x)
-            city_y = int(city_y * zoom + offset_y)
-            
-            for neighbor in city.neighbors:
-                if neighbor in self.game.cities:  # Ensure neighbor is in our cities list
-                    nx, ny = neighbor.coordinates
-                    nx = int(nx * zoom + offset_x)
-                    ny = int(ny * zoom + offset_y)
-                    
-                    # Draw animated neon connection lines
-                    dx = abs(city_x - nx)
-                    # Use green if disease is cured, otherwise use disease color
-                    if city.disease.has_cure:
-                        neon_base = (0, 255, 0)  # Bright green for cured diseases
-                        shadow = (0, 100, 0)     # Darker green shadow
-                    else:
-                        neon_base = (80,200,255) if city.disease.color=="Blue" else (255,220,90) if city.disease.color=="Yellow" else (255,80,180) if city.disease.color=="Red" else (170,80,255)
-                        shadow = (60,60,60)
-                    # Animate pulse along the edge
-                    pulse_speed = 2.0
-                    phase = t * pulse_speed + (city_x + city_y + nx + ny) * 0.005
-                    pulse = 0.5 + 0.5 * math.sin(phase)
-                    neon = tuple(min(255, int(c * (0.7 + 0.6 * pulse))) for c in neon_base)
-                    if dx > WIDTH // 2:
-                        if city_x > nx:
-                            pygame.draw.line(screen, shadow, (city_x, city_y+2), (nx+WIDTH, ny+2), 2)
-                            pygame.draw.line(screen, neon, (city_x, city_y), (nx+WIDTH, ny), 1)
-                        else:
-                            pygame.draw.line(screen, shadow, (city_x, city_y+2), (nx-WIDTH, ny+2), 2)
-                            pygame.draw.line(screen, neon, (city_x, city_y), (nx-WIDTH, ny), 1)
-                    else:
-                        pygame.draw.line(screen, shadow, (city_x, city_y+2), (nx, ny+2), 2)
-                        pygame.draw.line(screen, neon, (city_x, city_y), (nx, ny), 1)
+        for city, start, end in visible_edges:
+            city_x, city_y = camera.world_to_screen(*start)
+            nx, ny = camera.world_to_screen(*end)
+            # Draw animated neon connection lines
+            neon_base = self._get_neon_color(city)
+            shadow = (0, 100, 0) if city.disease.has_cure else (60,60,60)
+            if show_pulses:
+                # Animate pulse along the edge
+                pulse_speed = 2.0
+                phase = t * pulse_speed + (city_x + city_y + nx + ny) * 0.005
+                pulse = 0.5 + 0.5 * math.sin(phase)
+                neon = tuple(min(255, int(c * (0.7 + 0.6 * pulse))) for c in neon_base)
+            else:
+                neon = neon_base
+            if show_shadows:
+                pygame.draw.line(screen, shadow, (city_x, city_y+2), (nx, ny+2), 2)
+            pygame.draw.line(screen, neon, (city_x, city_y), (nx, ny), 1)
 
-        
         # Draw cities
-        for city in self.game.cities:
-            city_x, city_y = city.coordinates
-            city_x = int(city_x * zoom + offset_x)
-            city_y = int(city_y * zoom + offset_y)
-            
+        current_player = self.game.get_current_player() if self.game.players else None
+        for city in visible_cities:
+            city_x, city_y = camera.world_to_screen(*city.coordinates)
+
             # Draw pixelated shadow under city
-            pygame.draw.circle(screen, (40,40,40), (city_x, city_y+6), 13)
+            if show_shadows:
+                pygame.draw.circle(screen, (40,40,40), (city_x, city_y+6), 13)
             # Animate city pulse (smaller, faster)
-            city_idx = self.game.cities.index(city)
-            node_pulse = 0.85 + 0.15 * math.sin(t*5 + city_idx)
-            
-            # Use green if disease is cured, otherwise use disease color
-            if city.disease.has_cure:
-                neon_base = (0, 255, 0)  # Bright green for cured diseases
-            else:
-                neon_base = (80,200,255) if city.disease.color=="Blue" else (255,220,90) if city.disease.color=="Yellow" else (255,80,180) if city.disease.color=="Red" else (170,80,255)
-            
+            city_idx = self._city_index[city]
+            node_pulse = 0.85 + 0.15 * math.sin(t*5 + city_idx) if show_pulses else 1.0
+
+            neon_base = self._get_neon_color(city)
             neon = tuple(min(255, int(c * node_pulse)) for c in neon_base)
             radius = int(8 * node_pulse + 5)
             pygame.draw.circle(screen, neon, (city_x, city_y), radius)
             pygame.draw.circle(screen, (0,0,0), (city_x, city_y), int(radius*0.75))
             pygame.draw.circle(screen, neon, (city_x, city_y), int(radius*0.65))
             # Draw city name in pixel/arcade font (fallback to bold monospace)
-            font = pygame.font.SysFont('Press Start 2P,Consolas,Courier New,Arial', 17, bold=True)
-            # Use green text if disease is cured, otherwise use the default cyan color
-            text_color = (0, 255, 0) if city.disease.has_cure else (0, 255, 128)
-            text = font.render(city.name, True, text_color)
-            outline = font.render(city.name, True, (0,0,0))
-            screen.blit(outline, (city_x + 13, city_y - 5))
-            screen.blit(text, (city_x + 12, city_y - 6))
+            if show_labels:
+                # Use green text if disease is cured, otherwise use the default cyan color
+                text_color = CURED_LABEL_COLOR if city.disease.has_cure else LABEL_COLOR
+                text, outline = self.assets.city_label(city.name, text_color)
+                screen.blit(outline, (city_x + 13, city_y - 5))
+                screen.blit(text, (city_x + 12, city_y - 6))
             # Draw player tokens in this city
-            players_here = [p for p in self.game.players if p.city == city]
-            player_colors = [(0,255,255), (255,128,0), (0,255,128), (255,0,128), (255,255,0), (128,0,255), (255,0,0), (0,128,255)]
+            players_here = self._players_by_city.get(city, ())
             for idx, player in enumerate(players_here):
                 px = city_x + (idx-1.5)*18 if len(players_here) <= 4 else city_x + (idx-len(players_here)/2)*18
                 py = city_y - 27
-                color = player_colors[idx%len(player_colors)]
+                color = PLAYER_COLORS[idx%len(PLAYER_COLORS)]
                 # Highlight current player's token
-                if player == self.game.get_current_player():
+                if player == current_player:
                     pygame.draw.circle(screen, (255,255,255), (int(px), int(py)), 15)
                 pygame.draw.circle(screen, color, (int(px), int(py)), 12)
                 # Draw player initials
-                initials = ''.join([part[0] for part in player.name.split()]).upper()
-                initial_font = pygame.font.SysFont('Arial', 14, bold=True)
-                initial_text = initial_font.render(initials, True, (0,0,0))
-                screen.blit(initial_text, (int(px)-initial_text.get_width()//2, int(py)-initial_text.get_height()//2))
+                if show_initials:
+                    initials = ''.join([part[0] for part in player.name.split()]).upper()
+                    initial_text = self.assets.initials(initials)
+                    screen.blit(initial_text, (int(px)-initial_text.get_width()//2, int(py)-initial_text.get_height()//2))
             # Draw research center if built
             if city.has_center:
                 center_size = 15
-                pygame.draw.rect(screen, (255, 255, 255), 
-                               (city_x - center_size//2, city_y - center_size//2, 
+                pygame.draw.rect(screen, (255, 255, 255),
+                               (city_x - center_size//2, city_y - center_size//2,
                                 center_size, center_size))
-                pygame.draw.rect(screen, (0, 0, 0), 
-                               (city_x - center_size//2, city_y - center_size//2, 
+                pygame.draw.rect(screen, (0, 0, 0),
+                               (city_x - center_size//2, city_y - center_size//2,
                                 center_size, center_size), 2)
                 # Draw a plus sign inside the square
-                pygame.draw.line(screen, (0, 0, 0), 
-                               (city_x - center_size//4, city_y), 
+                pygame.draw.line(screen, (0, 0, 0),
+                               (city_x - center_size//4, city_y),
                                (city_x + center_size//4, city_y), 2)
-                pygame.draw.line(screen, (0, 0, 0), 
-                               (city_x, city_y - center_size//4), 
+                pygame.draw.line(screen, (0, 0, 0),
+                               (city_x, city_y - center_size//4),
                                (city_x, city_y + center_size//4), 2)
-            
+
             # Highlight selected city with rotating dashed neon ring
             if self.selected_city == city:
-                import math
-                t = time.time()
                 for i in range(12):
                     if (i + int(t*6)) % 2 == 0:
                         angle = i * math.pi/6
@@ -307,31 +405,24 @@ class Board:
                         y = int(city_y + 18 * math.sin(angle))
                         pygame.draw.circle(screen, neon, (x, y), 3)
 
+        self._present(screen)
+        self.quality.record_frame((time.perf_counter() - frame_start) * 1000)
+
 
     def handle_event(self, event):
         """Handle Pygame events"""
+        if hasattr(event, 'pos'):
+            # Events arrive in window coordinates; the board works in render surface coordinates
+            event = pygame.event.Event(event.type, {**event.__dict__, 'pos': self._to_render_pos(event.pos)})
+        if self._city_grid is not None and self.camera.handle_event(event, self._to_render_pos(pygame.mouse.get_pos())):
+            return
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
                 mouse_x, mouse_y = event.pos
                 # If in move mode, check if a neighbor city was clicked
                 if self.move_mode:
-                    # Calculate zoom/offset to match draw()
-                    min_x = min(c.coordinates[0] for c in self.game.cities)
-                    max_x = max(c.coordinates[0] for c in self.game.cities)
-                    min_y = min(c.coordinates[1] for c in self.game.cities)
-                    max_y = max(c.coordinates[1] for c in self.game.cities)
-                    spread_x = max_x - min_x
-                    spread_y = max_y - min_y
-                    margin = 60
-                    zoom_x = (WIDTH - 2 * margin) / spread_x if spread_x > 0 else 1.0
-                    zoom_y = (HEIGHT - 2 * margin) / spread_y if spread_y > 0 else 1.0
-                    zoom = min(zoom_x, zoom_y) * 0.9
-                    offset_x = (WIDTH - (spread_x * zoom)) // 2 - int(min_x * zoom)
-                    offset_y = (HEIGHT - (spread_y * zoom)) // 2 - int(min_y * zoom)
                     for city in self.highlighted_cities:
-                        city_x, city_y = city.coordinates
-                        city_x = int(city_x * zoom + offset_x)
-                        city_y = int(city_y * zoom + offset_y)
+                        city_x, city_y = self.camera.world_to_screen(*city.coordinates)
                         distance = math.sqrt((mouse_x - city_x) ** 2 + (mouse_y - city_y) ** 2)
                         if distance < 20:
                             # Move to this city
@@ -363,22 +454,9 @@ class Board:
                             self.game.perform_action(action)
                             return
                 # Otherwise, check if a city was clicked (for selection, not movement)
-                for city in self.game.cities:
-                    city_x, city_y = city.coordinates
-                    min_x = min(c.coordinates[0] for c in self.game.cities)
-                    max_x = max(c.coordinates[0] for c in self.game.cities)
-                    min_y = min(c.coordinates[1] for c in self.game.cities)
-                    max_y = max(c.coordinates[1] for c in self.game.cities)
-                    spread_x = max_x - min_x
-                    spread_y = max_y - min_y
-                    offset_x = (WIDTH - spread_x) // 2 - min_x
-                    offset_y = (HEIGHT - spread_y) // 2 - min_y
-                    city_x = int(city_x + offset_x)
-                    city_y = int(city_y + offset_y)
-                    distance = math.sqrt((mouse_x - city_x) ** 2 + (mouse_y - city_y) ** 2)
-                    if distance < 10:
-                        self.selected_city = city
-                        print(f"Selected city: {city.name}")
-                        break
+                city = self._city_at(event.pos, 10) if self._city_grid is not None else None
+                if city is not None:
+                    self.selected_city = city
+                    print(f"Selected city: {city.name}")
                 else:
-                    self.selected_city = None
\ No newline at end of file
+                    self.selected_city = None
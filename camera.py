@@ -0,0 +1,187 @@
+import math
+import pygame
+from typing import Dict, List, Tuple
+
+Rect = Tuple[float, float, float, float]
+
+MIN_FIT_ZOOM = 1e-3
+
+
+class SpatialGrid:
+    """Uniform grid that buckets items by the world-space cells they cover.
+
+    Pick a cell size on the scale of the map (e.g. a small multiple of the
+    distance between cities): too small and long items fill huge numbers of
+    cells, too large and everything shares a cell and culling stops working.
+    """
+
+    def __init__(self, cell_size: float = 256):
+        self.cell_size = cell_size
+        self.items: list = []
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def _cell_range(self, rect: Rect):
+        x0, y0, x1, y1 = rect
+        size = self.cell_size
+        return int(x0 // size), int(y0 // size), int(x1 // size), int(y1 // size)
+
+    def insert(self, item, rect: Rect) -> None:
+        """Insert an item covering the (x0, y0, x1, y1) world rectangle."""
+        index = len(self.items)
+        self.items.append(item)
+        cx0, cy0, cx1, cy1 = self._cell_range(rect)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self.cells.setdefault((cx, cy), []).append(index)
+
+    def insert_segment(self, item, start: Tuple[float, float], end: Tuple[float, float]) -> None:
+        """Insert a line segment, bucketed only in the cells it passes through,
+        so a long diagonal costs O(length / cell_size) instead of its bounding box."""
+        index = len(self.items)
+        self.items.append(item)
+        for cell in self._segment_cells(start, end):
+            self.cells.setdefault(cell, []).append(index)
+
+    def _segment_cells(self, start, end) -> List[Tuple[int, int]]:
+        """Cells crossed by the segment, walked one cell border at a time"""
+        size = self.cell_size
+        (x0, y0), (x1, y1) = start, end
+        cx, cy = int(x0 // size), int(y0 // size)
+        steps = abs(int(x1 // size) - cx) + abs(int(y1 // size) - cy)
+        dx, dy = x1 - x0, y1 - y0
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        # Distance along the segment (0..1) to the next vertical / horizontal cell border
+        next_x = ((cx + (step_x > 0)) * size - x0) / dx if dx else math.inf
+        next_y = ((cy + (step_y > 0)) * size - y0) / dy if dy else math.inf
+        delta_x = size / abs(dx) if dx else math.inf
+        delta_y = size / abs(dy) if dy else math.inf
+        cells = [(cx, cy)]
+        for _ in range(steps):
+            if next_x < next_y:
+                cx += step_x
+                next_x += delta_x
+            else:
+                cy += step_y
+                next_y += delta_y
+            cells.append((cx, cy))
+        return cells
+
+    def query(self, rect: Rect) -> list:
+        """Return the items whose cells intersect rect, in insertion order."""
+        cx0, cy0, cx1, cy1 = self._cell_range(rect)
+        found = set()
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self.cells):
+            # Viewport covers more cells than are populated: scan the buckets instead
+            for (cx, cy), indices in self.cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    found.update(indices)
+        else:
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    indices = self.cells.get((cx, cy))
+                    if indices:
+                        found.update(indices)
+        return [self.items[i] for i in sorted(found)]
+
+
+class Camera:
+    """World-to-screen transform with mouse-wheel zoom and drag-to-pan.
+
+    The camera starts by fitting the map bounds to the screen, exactly like the
+    board used to do every frame. User zoom (`level`) and pan are applied on top
+    of that fit, so resizing the window keeps the current view.
+    """
+
+    def __init__(self, margin: int = 60, min_level: float = 0.5, max_level: float = 12.0):
+        self.margin = margin
+        self.min_level = min_level
+        self.max_level = max_level
+        self.level = 1.0
+        self.pan_x = 0.0
+        self.pan_y = 0.0
+        self.width = 0
+        self.height = 0
+        self.fit_zoom = 1.0
+        self.zoom = 1.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self._bounds: Rect = (0, 0, 0, 0)
+        self._drag_pos = None
+
+    def update(self, bounds: Rect, width: int, height: int) -> None:
+        """Recompute the transform for the map bounds and screen size."""
+        self._bounds = bounds
+        self.width, self.height = width, height
+        min_x, min_y, max_x, max_y = bounds
+        spread_x = max_x - min_x
+        spread_y = max_y - min_y
+        # Only keep the margin on axes with room for it, and never let the zoom
+        # reach zero: the transform has to stay invertible on tiny surfaces
+        margin_x = self.margin if width > 2 * self.margin else 0
+        margin_y = self.margin if height > 2 * self.margin else 0
+        zoom_x = (width - 2 * margin_x) / spread_x if spread_x > 0 else 1.0
+        zoom_y = (height - 2 * margin_y) / spread_y if spread_y > 0 else 1.0
+        self.fit_zoom = max(min(zoom_x, zoom_y) * 0.9, MIN_FIT_ZOOM)
+        fit_offset_x = (width - (spread_x * self.fit_zoom)) // 2 - int(min_x * self.fit_zoom)
+        fit_offset_y = (height - (spread_y * self.fit_zoom)) // 2 - int(min_y * self.fit_zoom)
+        # Zoom around the screen center, then apply the user pan
+        center_x, center_y = width / 2, height / 2
+        self.zoom = self.fit_zoom * self.level
+        self.offset_x = (fit_offset_x - center_x) * self.level + center_x + self.pan_x
+        self.offset_y = (fit_offset_y - center_y) * self.level + center_y + self.pan_y
+
+    def world_to_screen(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x * self.zoom + self.offset_x), int(y * self.zoom + self.offset_y)
+
+    def screen_to_world(self, sx: float, sy: float) -> Tuple[float, float]:
+        return (sx - self.offset_x) / self.zoom, (sy - self.offset_y) / self.zoom
+
+    def viewport(self, padding: int = 0) -> Rect:
+        """World rectangle currently on screen, grown by `padding` screen pixels."""
+        x0, y0 = self.screen_to_world(-padding, -padding)
+        x1, y1 = self.screen_to_world(self.width + padding, self.height + padding)
+        return x0, y0, x1, y1
+
+    def zoom_at(self, factor: float, pos: Tuple[int, int]) -> None:
+        """Zoom by `factor`, keeping the world point under `pos` fixed."""
+        level = max(self.min_level, min(self.max_level, self.level * factor))
+        if level == self.level:
+            return
+        world_x, world_y = self.screen_to_world(*pos)
+        self.level = level
+        self.update(self._bounds, self.width, self.height)
+        self.pan_x += pos[0] - (world_x * self.zoom + self.offset_x)
+        self.pan_y += pos[1] - (world_y * self.zoom + self.offset_y)
+        self.update(self._bounds, self.width, self.height)
+
+    def pan_by(self, dx: float, dy: float) -> None:
+        self.pan_x += dx
+        self.pan_y += dy
+        self.update(self._bounds, self.width, self.height)
+
+    def reset(self) -> None:
+        """Go back to the fit-to-screen view."""
+        self.level = 1.0
+        self.pan_x = self.pan_y = 0.0
+        self.update(self._bounds, self.width, self.height)
+
+    def handle_event(self, event, mouse_pos: Tuple[int, int] = None) -> bool:
+        """Handle zoom/pan events. Returns True if the event was consumed."""
+        if event.type == pygame.MOUSEWHEEL:
+            self.zoom_at(1.15 ** event.y, mouse_pos or pygame.mouse.get_pos())
+            return True
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button in (2, 3):  # Middle/right drag pans
+            self._drag_pos = event.pos
+            return True
+        if event.type == pygame.MOUSEBUTTONUP and event.button in (2, 3):
+            self._drag_pos = None
+            return True
+        if event.type == pygame.MOUSEMOTION and self._drag_pos is not None:
+            self.pan_by(event.pos[0] - self._drag_pos[0], event.pos[1] - self._drag_pos[1])
+            self._drag_pos = event.pos
+            return True
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_HOME:
+            self.reset()
+            return True
+        return False
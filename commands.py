@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional, TYPE_CHECKING
 from city import City
+from events import CubesChanged, CenterBuilt, CureFound, PlayerMoved
 
 if TYPE_CHECKING:
     from player import Player
@@ -18,6 +19,11 @@ class Command(ABC):
         """Undo the command."""
         pass
 
+    def emit(self, event_type, *args) -> None:
+        """Publish a change event on the player's event bus, if any."""
+        if self.player.events is not None:
+            self.player.events.emit(event_type, *args)
+
 class MoveCommand(Command):
     """Command to move a player to a new city."""
     
@@ -29,11 +35,13 @@ class MoveCommand(Command):
     def execute(self) -> bool:
         self.previous_city = self.player.city
         self.player.city = self.new_city
+        self.emit(PlayerMoved, self.player, self.previous_city, self.new_city)
         return True
     
     def undo(self) -> None:
         if self.previous_city:
             self.player.city = self.previous_city
+            self.emit(PlayerMoved, self.player, self.new_city, self.previous_city)
 
 class TreatDiseaseCommand(Command):
     """Command to treat disease in the player's current city."""
@@ -46,12 +54,14 @@ class TreatDiseaseCommand(Command):
         if self.player.city.disease_quantity > 0:
             self.player.city.disease_quantity -= 1
             self.treated = True
+            self.emit(CubesChanged, self.player.city, self.player.city.disease_quantity)
             return True
         return False
     
     def undo(self) -> None:
         if self.treated:
             self.player.city.disease_quantity += 1
+            self.emit(CubesChanged, self.player.city, self.player.city.disease_quantity)
 
 class BuildCenterCommand(Command):
     """Command to build a research center in the player's current city."""
@@ -64,12 +74,14 @@ class BuildCenterCommand(Command):
         if not self.player.city.has_center:
             self.player.city.has_center = True
             self.was_built = True
+            self.emit(CenterBuilt, self.player.city, True)
             return True
         return False
     
     def undo(self) -> None:
         if self.was_built:
             self.player.city.has_center = False
+            self.emit(CenterBuilt, self.player.city, False)
 
 class FindCureCommand(Command):
     """Command to find a cure for the disease in the player's current city."""
@@ -81,8 +93,11 @@ class FindCureCommand(Command):
     def execute(self) -> bool:
         self.had_cure = self.player.city.disease.has_cure
         self.player.city.disease.has_cure = True
+        if not self.had_cure:
+            self.emit(CureFound, self.player.city.disease, True)
         return True
     
     def undo(self) -> None:
         if not self.had_cure:
             self.player.city.disease.has_cure = False
+            self.emit(CureFound, self.player.city.disease, False)
@@ -0,0 +1,166 @@
+import abc
+import fnmatch
+import gc
+import os
+import time
+import tracemalloc
+from collections import deque
+
+import pygame
+from commands import Command
+
+
+# Allocations made by the instrumentation itself, not by the game
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, abc.__file__),
+    tracemalloc.Filter(False, "<frozen abc>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def count_live_objects() -> dict:
+    """Count live Surface and Command objects.
+
+    Surfaces are not tracked by the garbage collector, so they are found
+    through the containers that reference them (lists, dicts, tuples,
+    objects), which covers everything the game keeps alive.
+    """
+    # Exact type lookups: isinstance against the Command ABC would fill its
+    # subclass cache with every type on the heap
+    command_types = set(Command.__subclasses__())
+    surfaces = set()
+    commands = 0
+    for obj in gc.get_objects():
+        if type(obj) in command_types:
+            commands += 1
+        for referent in gc.get_referents(obj):
+            if isinstance(referent, pygame.Surface):
+                surfaces.add(id(referent))
+            elif type(referent) is tuple:
+                # Tuples holding only untracked objects are untracked themselves
+                surfaces.update(id(item) for item in referent if isinstance(item, pygame.Surface))
+    return {'Surface': len(surfaces), 'Command': commands}
+
+
+class Diagnostics:
+    """Memory and allocation instrumentation for long-running sessions.
+
+    Traces allocations with tracemalloc, records the net allocation of each
+    frame and, every `interval` seconds, takes a snapshot and compares it
+    with a baseline to find the sites that keep growing. The baseline is
+    taken after `warmup_frames`, once the board has built its one-time
+    caches. The resulting leak report can be written to a file and shown as
+    an overlay.
+
+    Counting live objects walks the whole heap and stalls the frame it runs
+    on, so it is off unless `count_objects` is set.
+    """
+
+    def __init__(self, game, interval: float = 60.0, report_path: str = None, top: int = 10, frames: int = 600,
+                 warmup_frames: int = 120, count_objects: bool = False):
+        self.game = game
+        self.interval = interval
+        self.report_path = report_path
+        self.top = top
+        self.warmup_frames = warmup_frames
+        self.count_objects = count_objects
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(5)
+        self.started = time.time()
+        self._frames = 0
+        self._baseline = None
+        # Filtering compiles and caches its patterns on first use; do it now so
+        # that cache doesn't show up as growth after the baseline
+        for trace_filter in SNAPSHOT_FILTERS:
+            fnmatch.fnmatch('', trace_filter.filename_pattern)
+        self._last_snapshot = time.time()
+        self._last_traced = tracemalloc.get_traced_memory()[0]
+        self.frame_deltas = deque(maxlen=frames)  # Net bytes allocated by each recent frame
+        self.live_objects = None
+        self.growth = []  # Top tracemalloc.StatisticDiff since the baseline
+        self.overlay = False
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+    def frame(self) -> None:
+        """Call once per frame, after everything (overlay included) is drawn."""
+        traced = tracemalloc.get_traced_memory()[0]
+        self.frame_deltas.append(traced - self._last_traced)
+        self._last_traced = traced
+        self._frames += 1
+        if self._baseline is None:
+            if self._frames >= self.warmup_frames:
+                self._baseline = self._snapshot()
+                self._last_snapshot = time.time()
+                self._last_traced = tracemalloc.get_traced_memory()[0]
+        elif time.time() - self._last_snapshot >= self.interval:
+            self.take_snapshot()
+
+    def take_snapshot(self) -> None:
+        """Compare the current heap with the baseline and refresh the report."""
+        self._last_snapshot = time.time()
+        if self._baseline is not None:
+            stats = self._snapshot().compare_to(self._baseline, 'lineno')
+            self.growth = [stat for stat in stats if stat.size_diff > 0][:self.top]
+        if self.count_objects:
+            self.live_objects = count_live_objects()
+        if self.report_path:
+            self.write_report(self.report_path)
+        # Don't count the snapshot's own allocations against the next frame
+        self._last_traced = tracemalloc.get_traced_memory()[0]
+
+    def summary(self) -> list:
+        """Short status lines for the overlay."""
+        current, peak = tracemalloc.get_traced_memory()
+        average = sum(self.frame_deltas) / len(self.frame_deltas) if self.frame_deltas else 0
+        history = sum(len(player.command_history) for player in self.game.players)
+        return [
+            f"Uptime: {time.time() - self.started:.0f}s",
+            f"Traced memory: {_format_bytes(current)} (peak {_format_bytes(peak)})",
+            f"Frame allocation delta: {_format_bytes(average)} avg",
+            (f"Live Surfaces: {self.live_objects['Surface']}  Commands: {self.live_objects['Command']}"
+             if self.live_objects else "Live objects: not counted"),
+            f"Command history entries: {history}",
+        ]
+
+    def report(self) -> str:
+        lines = ["Memory diagnostics"] + self.summary()
+        if self._baseline is None:
+            lines.append(f"Baseline pending ({self._frames}/{self.warmup_frames} warm-up frames)")
+        lines.append(f"Top growth since baseline ({len(self.growth)} sites):")
+        for stat in self.growth:
+            frame = stat.traceback[0]
+            lines.append(f"  {frame.filename}:{frame.lineno}  +{_format_bytes(stat.size_diff)} "
+                         f"({stat.count_diff:+d} blocks)")
+        return "\n".join(lines)
+
+    def write_report(self, path: str) -> None:
+        with open(path, 'w') as f:
+            f.write(self.report() + "\n")
+
+    def draw_overlay(self, surface, font) -> None:
+        """Draw the status lines and top growth sites in the top-left corner."""
+        lines = self.summary() + [f"+{_format_bytes(s.size_diff)} {os.path.basename(s.traceback[0].filename)}:{s.traceback[0].lineno}"
+                                  for s in self.growth[:5]]
+        rendered = [font.render(line, True, (255, 255, 255)) for line in lines]
+        width = max(text.get_width() for text in rendered) + 20
+        height = sum(text.get_height() for text in rendered) + 20
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        surface.blit(panel, (20, 20))
+        y = 30
+        for text in rendered:
+            surface.blit(text, (30, y))
+            y += text.get_height()
@@ -0,0 +1,132 @@
+class GameEvent:
+    """Base class for model change events. Events with the same key are
+    coalesced into one when delivered in a batch."""
+
+    def key(self):
+        return type(self)
+
+    def merge(self, later: 'GameEvent') -> 'GameEvent':
+        """Combine this event with a later one with the same key."""
+        return later
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={value!r}" for name, value in vars(self).items())
+        return f"{type(self).__name__}({fields})"
+
+
+class CubesChanged(GameEvent):
+    def __init__(self, city, quantity: int):
+        self.city = city
+        self.quantity = quantity
+
+    def key(self):
+        return (CubesChanged, self.city)
+
+
+class CenterBuilt(GameEvent):
+    """A research center was built (or removed, when `built` is False)."""
+
+    def __init__(self, city, built: bool = True):
+        self.city = city
+        self.built = built
+
+    def key(self):
+        return (CenterBuilt, self.city)
+
+
+class CureFound(GameEvent):
+    """A disease was cured (or the cure was undone, when `cured` is False)."""
+
+    def __init__(self, disease, cured: bool = True):
+        self.disease = disease
+        self.cured = cured
+
+    def key(self):
+        return (CureFound, self.disease)
+
+
+class PlayerMoved(GameEvent):
+    def __init__(self, player, from_city, to_city):
+        self.player = player
+        self.from_city = from_city
+        self.to_city = to_city
+
+    def key(self):
+        return (PlayerMoved, self.player)
+
+    def merge(self, later):
+        return PlayerMoved(self.player, self.from_city, later.to_city)
+
+
+class TurnAdvanced(GameEvent):
+    def __init__(self, player_index: int):
+        self.player_index = player_index
+
+
+def coalesce(events: list) -> list:
+    """Merge events with the same key, keeping the order of first occurrence."""
+    merged = {}
+    for event in events:
+        key = event.key()
+        merged[key] = merged[key].merge(event) if key in merged else event
+    return list(merged.values())
+
+
+class EventBus:
+    """Publishes model change events to subscribers.
+
+    Subscribers either get every event as it happens (`batch=None`) or a
+    coalesced list of events when the game flushes a batch: 'action' is
+    flushed after every action and 'frame' once per rendered frame.
+    Events are only built when someone listens for their type, so emitting
+    on a bus without subscribers costs a single check.
+    """
+
+    BATCHES = ('action', 'frame')
+
+    def __init__(self):
+        self._subscriptions = []  # (callback, event types or None for all, batch)
+        self._pending = {batch: [] for batch in self.BATCHES}
+
+    def subscribe(self, callback, event_types=None, batch: str = None):
+        """Call `callback(event)`, or `callback(events)` for batched
+        subscribers, for events of the given types (all types if None)."""
+        if batch is not None and batch not in self.BATCHES:
+            raise ValueError(f"Unknown batch: {batch}")
+        types = tuple(event_types) if event_types is not None else None
+        self._subscriptions.append((callback, types, batch))
+        return callback
+
+    def unsubscribe(self, callback) -> None:
+        self._subscriptions = [s for s in self._subscriptions if s[0] != callback]
+
+    def emit(self, event_type, *args) -> None:
+        """Build an `event_type(*args)` event and dispatch it."""
+        if not self._subscriptions:
+            return
+        event = None
+        queued = set()
+        for callback, types, batch in self._subscriptions:
+            if types is not None and event_type not in types:
+                continue
+            if event is None:
+                event = event_type(*args)
+            if batch is None:
+                callback(event)
+            elif batch not in queued:
+                self._pending[batch].append(event)
+                queued.add(batch)
+
+    def flush(self, batch: str) -> None:
+        """Deliver the coalesced events queued for `batch`."""
+        pending = self._pending[batch]
+        if not pending:
+            return
+        self._pending[batch] = []
+        events = coalesce(pending)
+        for callback, types, subscribed_batch in list(self._subscriptions):
+            if subscribed_batch != batch:
+                continue
+            wanted = events if types is None else [e for e in events if type(e) in types]
+            if wanted:
+                callback(wanted)
@@ -0,0 +1,119 @@
+"""Offscreen export of recorded games to PNG sequences or raw RGB streams.
+
+Frames are rendered with Board's drawing code on in-memory surfaces using the
+dummy SDL video driver, so no window is opened. Frame ranges are spread over a
+process pool; animation time is derived from the frame number, so every frame
+is identical no matter which worker renders it.
+
+Example (pipe to ffmpeg):
+    python export.py game.json --format rgb --output - | \\
+        ffmpeg -f rawvideo -pix_fmt rgb24 -s 1280x720 -r 30 -i - game.mp4
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+# SDL otherwise traps SIGTERM in the workers and the pool can never terminate them
+os.environ.setdefault('SDL_NO_SIGNAL_HANDLERS', '1')
+
+import argparse
+import sys
+from collections import deque
+from multiprocessing import Pool
+
+import pygame
+from quality import parse_size
+from replay import load_replay, ReplayPlayer
+
+
+def frame_count(replay: dict, frames_per_action: int) -> int:
+    """One block of frames for the initial state plus one after every action."""
+    return (len(replay['actions']) + 1) * frames_per_action
+
+
+def render_frames(replay: dict, start: int, end: int, size, fps: int, frames_per_action: int):
+    """Yield (frame number, surface) for frames [start, end) of the replay."""
+    from board import Board
+    pygame.init()
+    player = ReplayPlayer(replay)
+    surface = pygame.Surface(size)
+    board = Board(player.game, surface=surface)
+    for frame in range(start, end):
+        player.seek(frame // frames_per_action)
+        board.draw(t=frame / fps)
+        yield frame, surface
+
+
+def _export_chunk(job):
+    """Worker: render one frame range. PNGs are written directly, raw RGB
+    bytes are returned so the parent can write them in order."""
+    replay, start, end, size, fps, frames_per_action, fmt, output = job
+    data = []
+    for frame, surface in render_frames(replay, start, end, size, fps, frames_per_action):
+        if fmt == 'png':
+            pygame.image.save(surface, os.path.join(output, f"frame_{frame:06d}.png"))
+        else:
+            data.append(pygame.image.tobytes(surface, 'RGB'))
+    return b''.join(data)
+
+
+def _write_chunk(stream, data: bytes) -> None:
+    if stream is not None:
+        stream.write(data)
+
+
+def export(replay: dict, output: str, fmt: str = 'png', size=(1280, 720), fps: int = 30,
+           frames_per_action: int = 30, workers: int = None, chunk_size: int = 60) -> int:
+    """Render a replay to `output` and return the number of frames written.
+
+    At most two chunks per worker are in flight, so raw RGB output holds at
+    most 2 * workers * chunk_size frames in memory however slow the reader is.
+    """
+    workers = workers or os.cpu_count() or 1
+    total = frame_count(replay, frames_per_action)
+    jobs = [(replay, start, min(start + chunk_size, total), size, fps, frames_per_action, fmt, output)
+            for start in range(0, total, chunk_size)]
+    if fmt == 'png':
+        os.makedirs(output, exist_ok=True)
+        stream = None
+    else:
+        stream = sys.stdout.buffer if output == '-' else open(output, 'wb')
+    try:
+        with Pool(workers) as pool:
+            # Results are collected in submission order, so raw frames reach the
+            # stream in sequence; new chunks are only queued as old ones are written
+            in_flight = deque()
+            for job in jobs:
+                in_flight.append(pool.apply_async(_export_chunk, (job,)))
+                if len(in_flight) >= 2 * workers:
+                    _write_chunk(stream, in_flight.popleft().get())
+            while in_flight:
+                _write_chunk(stream, in_flight.popleft().get())
+            pool.close()
+            pool.join()
+    finally:
+        if stream is not None and stream is not sys.stdout.buffer:
+            stream.close()
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a recorded Pandemic game to frames")
+    parser.add_argument('replay', help="replay file recorded with main.py --record")
+    parser.add_argument('--output', default='frames',
+                        help="directory for PNG frames, or file for raw RGB ('-' for stdout)")
+    parser.add_argument('--format', choices=['png', 'rgb'], default='png')
+    parser.add_argument('--size', type=parse_size, default='1280x720', metavar='WxH')
+    parser.add_argument('--fps', type=int, default=30)
+    parser.add_argument('--frames-per-action', type=int, default=30)
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument('--chunk-size', type=int, default=60,
+                        help="frames per job; raw RGB keeps up to 2 x workers chunks in memory (default: 60)")
+    args = parser.parse_args(argv)
+
+    total = export(load_replay(args.replay), args.output, args.format, args.size, args.fps,
+                   args.frames_per_action, args.workers, args.chunk_size)
+    print(f"Exported {total} frames", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,15 @@
 from city import City
 from disease import Disease
 from player import Player
+from events import EventBus, TurnAdvanced
 import random
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed: int = None):
+        # All game randomness comes from this generator, so a game can be
+        # reproduced from its seed and its action log
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(32)
+        self.rng = random.Random(self.seed)
         self.cities: list[City] = []
         self.diseases: list[Disease] = []
         self.players: list[Player] = []
@@ -12,6 +17,9 @@ class Game:
         self.outbreaks = 0
         self.current_player_index = 0
         self.turn_actions_remaining = 1  # Changed from 4 to 1 for one action per turn 
+        self.starting_cities = []
+        self.action_log = []  # Every turn's action, as replays need it (see log_entry)
+        self.events = EventBus()
 
     def get_current_player(self):
         return self.players[self.current_player_index]
@@ -19,16 +27,32 @@ class Game:
     def next_turn(self):
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
         self.turn_actions_remaining = 1  # Changed from 4 to 1 for one action per turn
+        self.events.emit(TurnAdvanced, self.current_player_index)
 
     def perform_action(self, action, *args, **kwargs):
         if self.turn_actions_remaining > 0:
+            self.action_log.append(self.log_entry(action, *args))
             player = self.get_current_player()
             player.play(action, *args, **kwargs)
             self.turn_actions_remaining -= 1
             if self.turn_actions_remaining == 0:
                 self.next_turn()
-
-    def set_game_initial_state(self):
+            self.events.flush('action')
+
+    @staticmethod
+    def log_entry(action, *args) -> list:
+        """The JSON-safe record of an action: its name, plus the target city's name
+        for a move. Player.play ignores any other argument, and an invalid move
+        is logged without a city so it replays as the same no-op."""
+        if action == 'move' and args and isinstance(args[0], City):
+            return [action, args[0].name]
+        return [action]
+
+    def get_city(self, name):
+        """Return the city called `name`, or None if the map has none."""
+        return next((city for city in self.cities if city.name == name), None)
+
+    def set_game_initial_state(self, starting_cities=None):
         blueDisease = Disease("Blue")
         yellowDisease = Disease("Yellow")
         redDisease = Disease("Red")
@@ -198,15 +222,19 @@ class Game:
         self.cities.append(kolkata)
 
         
-        # Choose 4 random cities
-        startingCities = random.sample(self.cities, 4)
+        # Choose 4 random cities, unless replaying a recorded game
+        if starting_cities:
+            startingCities = [self.get_city(name) for name in starting_cities]
+        else:
+            startingCities = self.rng.sample(self.cities, 4)
+        self.starting_cities = [city.name for city in startingCities]
 
         # Initialize players
         self.players = [
-            Player("Fernando", startingCities[0]),
-            Player("Rafael", startingCities[1]),
-            Player("Oliver", startingCities[2]),
-            Player("Patricia", startingCities[3])
+            Player("Fernando", startingCities[0], self.events),
+            Player("Rafael", startingCities[1], self.events),
+            Player("Oliver", startingCities[2], self.events),
+            Player("Patricia", startingCities[3], self.events)
         ]
     
     def check_ending_conditions(self):
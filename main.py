@@ -1,43 +1,133 @@
+import sys
+from startup import StartupProfile
+
+# With --startup-profile, import main's dependencies through the profiler first
+# so it can report the time of every module they load; the imports below then
+# find them already loaded. Without the flag they are plain imports.
+profile = StartupProfile()
+if '--startup-profile' in sys.argv:
+    profile.time_imports(['argparse', 'concurrent.futures', 'pygame', 'game', 'board', 'assets',
+                          'quality', 'replay', 'diagnostics'])
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pygame
 from game import Game
-from board import Board
-
-# Initialize Pygame
-pygame.init()
+from board import Board, desktop_size, draw_loading_screen
+from assets import Assets
+from quality import QualityController, QUALITY_LEVELS, parse_size
+from replay import save_replay
+from diagnostics import Diagnostics
 
-# Screen dimensions
-WIDTH, HEIGHT = 1200, 800
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Pandemic Board Game")
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pandemic board game")
+    parser.add_argument('--render-size', type=parse_size, metavar='WxH',
+                        help="render at a fixed internal resolution (e.g. 1280x720) and scale it to the window")
+    parser.add_argument('--quality', choices=QUALITY_LEVELS + ['auto'], default='high',
+                        help="visual effects preset; 'auto' starts high and steps down when frames run over budget")
+    parser.add_argument('--record', metavar='PATH',
+                        help="save the game's actions to a replay file on exit (see export.py)")
+    parser.add_argument('--startup-profile', action='store_true',
+                        help="print import times and time-to-first-frame")
+    parser.add_argument('--diagnostics', action='store_true',
+                        help="trace memory allocations; F3 toggles the overlay")
+    parser.add_argument('--diagnostics-interval', type=float, default=60.0, metavar='SECONDS',
+                        help="seconds between tracemalloc snapshots (default: 60)")
+    parser.add_argument('--diagnostics-report', metavar='PATH',
+                        help="write the leak report to this file after every snapshot and on exit")
+    parser.add_argument('--diagnostics-objects', action='store_true',
+                        help="also count live Surface/Command objects at each snapshot; this walks "
+                             "the whole heap and stalls that frame for up to about a second")
+    parser.add_argument('--seed', type=int,
+                        help="seed for the game's random generator, to replay the same setup")
+    return parser.parse_args(argv)
 
-# Colors
-WHITE = (255, 255, 255)
+def load_game(seed=None):
+    """Build the map and the board's fonts and labels. Runs on a background thread."""
+    game = Game(seed)
+    game.set_game_initial_state()
+    assets = Assets(game.cities)
+    return game, assets
 
-def main():
+def main(argv=None):
     """Main game loop"""
-    clock = pygame.time.Clock()
-    from board import WIDTH, HEIGHT
-    screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+    args = parse_args(argv)
+    if args.quality == 'auto':
+        quality = QualityController('high', auto=True)
+    else:
+        quality = QualityController(args.quality)
+
+    # Initialize Pygame and create the window, once
+    pygame.init()
+    screen = pygame.display.set_mode(desktop_size(), pygame.RESIZABLE)
     pygame.display.set_caption("Pandemic")
-    game = Game()
-    game.set_game_initial_state()
-    board = Board(game)
-    game.start_game() 
+    profile.mark('window created')
+    clock = pygame.time.Clock()
+
+    # Show a first frame right away, then load everything else in the background
+    draw_loading_screen(screen, time.time())
+    pygame.display.flip()
+    profile.mark('first frame')
+    quit_requested = False
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        loading = executor.submit(load_game, args.seed)
+        while not loading.done() and not quit_requested:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    quit_requested = True
+            draw_loading_screen(screen, time.time())
+            pygame.display.flip()
+            clock.tick(60)
+    # Leaving the executor waits for the loader, so pygame is never shut down
+    # while it is still creating fonts and surfaces
+    if quit_requested:
+        if args.startup_profile:
+            print(profile.report())
+        pygame.quit()
+        return
+    game, assets = loading.result()
+    profile.mark('map and assets loaded')
+    print(f"Game seed: {game.seed}")
+
+    board = Board(game, render_size=args.render_size, quality=quality, assets=assets)
+    game.start_game()
+    diagnostics = None
+    if args.diagnostics or args.diagnostics_report:
+        diagnostics = Diagnostics(game, interval=args.diagnostics_interval, report_path=args.diagnostics_report,
+                                  count_objects=args.diagnostics_objects)
 
     running = True
+    first_board_frame = True
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            if diagnostics and event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                diagnostics.overlay = not diagnostics.overlay
             board.handle_event(event)
 
-        screen.fill(WHITE)
+        # The board clears the surface it draws on, so the window needs no fill of its own
         board.draw()
+        if diagnostics:
+            if diagnostics.overlay:
+                diagnostics.draw_overlay(screen, assets.font)
+            # After the overlay, so its allocations count against this frame
+            diagnostics.frame()
 
         pygame.display.flip()
+        if first_board_frame:
+            first_board_frame = False
+            profile.mark('first board frame')
+            if args.startup_profile:
+                print(profile.report())
         clock.tick(60)
-    
+
+    if args.record:
+        save_replay(game, args.record)
+    if diagnostics and args.diagnostics_report:
+        diagnostics.take_snapshot()
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
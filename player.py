@@ -1,11 +1,13 @@
 from city import City
 from commands import MoveCommand, TreatDiseaseCommand, BuildCenterCommand, FindCureCommand
+from events import EventBus
 
 class Player:
-    def __init__(self, name: str, city: City):
+    def __init__(self, name: str, city: City, events: EventBus = None):
         self.name = name
         self.city: City = city
         self.command_history = []
+        self.events = events  # Bus the player's commands publish their changes on
     
     def move(self, new_city: City) -> bool:
         """Move to a new city using the command pattern."""
@@ -0,0 +1,72 @@
+import argparse
+from collections import deque
+
+
+def parse_size(value: str):
+    """argparse type for WxH sizes such as 1280x720: exactly two positive integers."""
+    try:
+        width, height = (int(v) for v in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WxH, e.g. 1280x720, got {value!r}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"width and height must be positive, got {value!r}")
+    return width, height
+
+
+# Rendering presets, cheapest first
+QUALITY_LEVELS = ['low', 'medium', 'high']
+
+QUALITY_PRESETS = {
+    'low': {
+        'vignette': False,
+        'starfield': 0,        # Number of twinkling stars drawn
+        'glow': False,         # Static neon mini-glows
+        'pulses': False,       # Animated edge/city pulses
+        'smooth_scale': False  # smoothscale instead of scale when upscaling the render surface
+    },
+    'medium': {
+        'vignette': False,
+        'starfield': 40,
+        'glow': True,
+        'pulses': True,
+        'smooth_scale': False
+    },
+    'high': {
+        'vignette': True,
+        'starfield': 80,
+        'glow': True,
+        'pulses': True,
+        'smooth_scale': True
+    },
+}
+
+
+class QualityController:
+    """Holds the active quality preset and, in auto mode, steps it down when
+    the average frame time goes over the frame budget."""
+
+    def __init__(self, level: str = 'high', auto: bool = False, frame_budget_ms: float = 1000 / 60, window: int = 30):
+        if level not in QUALITY_PRESETS:
+            raise ValueError(f"Unknown quality level: {level}")
+        self.level = level
+        self.auto = auto
+        self.frame_budget_ms = frame_budget_ms
+        self._samples = deque(maxlen=window)
+
+    @property
+    def settings(self) -> dict:
+        return QUALITY_PRESETS[self.level]
+
+    def record_frame(self, frame_ms: float) -> None:
+        """Record how long the last frame took to render."""
+        if not self.auto:
+            return
+        self._samples.append(frame_ms)
+        if len(self._samples) < self._samples.maxlen:
+            return
+        average = sum(self._samples) / len(self._samples)
+        index = QUALITY_LEVELS.index(self.level)
+        if average > self.frame_budget_ms and index > 0:
+            self.level = QUALITY_LEVELS[index - 1]
+            print(f"Frame time {average:.1f}ms over budget, quality lowered to {self.level}")
+            self._samples.clear()
@@ -0,0 +1,48 @@
+import json
+from game import Game
+
+
+def save_replay(game: Game, path: str) -> None:
+    """Write the game's seed, starting cities and action log to a JSON replay file."""
+    replay = {
+        'seed': game.seed,
+        'starting_cities': game.starting_cities,
+        'actions': game.action_log
+    }
+    with open(path, 'w') as f:
+        json.dump(replay, f, indent=2)
+
+
+def load_replay(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+class ReplayPlayer:
+    """Rebuilds a recorded game and steps through its actions one at a time."""
+
+    def __init__(self, replay: dict):
+        self.replay = replay
+        self.game = Game(seed=replay.get('seed'))
+        # The seed alone reproduces the setup; starting cities are kept for replays recorded without one
+        self.game.set_game_initial_state(starting_cities=None if 'seed' in replay else replay['starting_cities'])
+        self.game.start_game()
+        self.position = 0  # Number of recorded actions applied so far
+
+    def __len__(self):
+        return len(self.replay['actions'])
+
+    def seek(self, position: int) -> Game:
+        """Apply recorded actions until `position` of them have been played.
+        Replays only move forward; seeking backwards rebuilds the game."""
+        position = min(position, len(self))
+        if position < self.position:
+            self.__init__(self.replay)
+        for action, *args in self.replay['actions'][self.position:position]:
+            if action == 'move':
+                # A missing or unknown city replays like the live game: a no-op that uses up the turn
+                city = self.game.get_city(args[0]) if args else None
+                args = [city] if city else []
+            self.game.perform_action(action, *args)
+        self.position = position
+        return self.game
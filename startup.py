@@ -0,0 +1,60 @@
+import builtins
+import os
+import sys
+import time
+
+# The game's own modules live next to this file; each gets its own line in the report
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class StartupProfile:
+    """Collects module import times and startup milestones for --startup-profile."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.imports = {}  # Module name -> seconds spent importing it
+        self.marks = []  # (milestone, seconds since the profile was created)
+
+    def time_imports(self, names) -> None:
+        """Import the given modules and every game module they pull in, recording
+        each one's own import time. A game module is not charged for the game
+        modules it imports, which are timed separately; other libraries are
+        charged to whichever game module or named dependency imported them."""
+        original_import = builtins.__import__
+        stack = []  # [top-level name, seconds spent in separately timed imports]
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level or name in sys.modules:
+                return original_import(name, globals, locals, fromlist, level)
+            package = name.partition('.')[0]
+            if stack and not os.path.exists(os.path.join(GAME_DIR, package + '.py')):
+                # A library or submodule: part of the importing module's time
+                return original_import(name, globals, locals, fromlist, level)
+            stack.append([package, 0.0])
+            start = time.perf_counter()
+            try:
+                return original_import(name, globals, locals, fromlist, level)
+            finally:
+                elapsed = time.perf_counter() - start
+                _, nested = stack.pop()
+                self.imports[package] = self.imports.get(package, 0.0) + elapsed - nested
+                if stack:
+                    stack[-1][1] += elapsed
+
+        builtins.__import__ = timed_import
+        try:
+            for name in names:
+                timed_import(name)
+        finally:
+            builtins.__import__ = original_import
+
+    def mark(self, milestone: str) -> None:
+        self.marks.append((milestone, time.perf_counter() - self.start))
+
+    def report(self) -> str:
+        lines = ["Startup profile:"]
+        for name, seconds in sorted(self.imports.items(), key=lambda item: -item[1]):
+            lines.append(f"  import {name:<18} {seconds * 1000:8.1f} ms")
+        for milestone, seconds in self.marks:
+            lines.append(f"  {milestone:<25} {seconds * 1000:8.1f} ms")
+        return "\n".join(lines)